@@ -510,7 +510,7 @@ def render_user_form(user_data: Dict[str, Any] = None, form_key: str = "user_for
         if submitted:
             # Validate form data
             validation_result = validate_user_profile_data(form_data)
-            validation_errors = validation_result.get('errors', [])
+            validation_errors = validation_result.get('errors') or []
             render_form_validation_feedback(validation_result, "hồ sơ người dùng")
             
     return form_data, validation_errors, submitted
@@ -748,7 +748,7 @@ def render_citizen_card_form(card_data: Dict[str, Any] = None,
 
             # Validate form data
             validation_result = validate_citizen_card_data(form_data)
-            validation_errors = validation_result.get('errors', [])
+            validation_errors = validation_result.get('errors') or []
             render_form_validation_feedback(validation_result, "thẻ CCCD")
             
     return form_data, validation_errors, submitted
@@ -960,7 +960,7 @@ def render_residence_form(residence_data: Dict[str, Any] = None,
 
             # Validate form data
             validation_result = validate_residence_data(form_data)
-            validation_errors = validation_result.get('errors', [])
+            validation_errors = validation_result.get('errors') or []
             
             # Use enhanced validation feedback
             render_form_validation_feedback(validation_result, "thông tin cư trú")
@@ -1260,7 +1260,7 @@ def render_household_member_form(
         if submitted:
             # Validate form data
             validation_result = validate_household_member_data(form_data)
-            validation_errors = validation_result.get('errors', [])
+            validation_errors = validation_result.get('errors') or []
             
             if validation_errors:
                 for error in validation_errors:
@@ -12,7 +12,9 @@ from firebase_admin import firestore
 from google.cloud.firestore_v1.base_query import FieldFilter
 
 try:
-    from firebase_admin_dashboard.utils.models import UserProfile, CitizenCard, Residence, HouseholdMember
+    from firebase_admin_dashboard.utils.models import (
+        UserProfile, CitizenCard, Residence, HouseholdMember, shared_timestamp
+    )
     from firebase_admin_dashboard.utils.validators import (
         validate_user_profile,
         validate_citizen_card,
@@ -20,7 +22,9 @@ try:
         validate_household_member_data,
     )
 except ImportError:
-    from utils.models import UserProfile, CitizenCard, Residence, HouseholdMember
+    from utils.models import (
+        UserProfile, CitizenCard, Residence, HouseholdMember, shared_timestamp
+    )
     from utils.validators import (
         validate_user_profile,
         validate_citizen_card,
@@ -51,6 +55,7 @@ class UserManager:
         self.citizen_cards_collection = db.collection('citizen_cards')
         self.residence_collection = db.collection('residence')
     
+    @shared_timestamp()
     def get_all_users(self, search_term: Optional[str] = None, 
                      date_filter: Optional[Dict[str, datetime]] = None,
                      limit: int = 100, offset: int = 0,
@@ -173,6 +178,7 @@ class UserManager:
             logger.error(f"Error retrieving users: {str(e)}")
             raise Exception(f"Failed to retrieve users: {str(e)}")
     
+    @shared_timestamp()
     def get_user_by_id(self, uid: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve complete user data including all related documents.
@@ -241,6 +247,7 @@ class UserManager:
             logger.error(f"Error retrieving user {uid}: {str(e)}")
             raise Exception(f"Failed to retrieve user {uid}: {str(e)}")
     
+    @shared_timestamp()
     def search_users_by_citizen_id(self, citizen_id: str) -> List[UserProfile]:
         """
         Search for users by citizen ID (for uniqueness validation).
@@ -258,11 +265,9 @@ class UserManager:
                 filter=FieldFilter('citizen_id', '==', citizen_id)
             )
             
-            users = []
-            for doc in query.stream():
-                user_data = doc.to_dict()
-                user_data['uid'] = doc.id
-                users.append(UserProfile.from_dict(user_data))
+            users = UserProfile.from_many(
+                {**doc.to_dict(), 'uid': doc.id} for doc in query.stream()
+            )
             
             logger.info(f"Found {len(users)} users with citizen_id: {citizen_id}")
             return users
@@ -1338,6 +1343,7 @@ class UserManager:
             logger.error(f"Error getting user summary for {uid}: {str(e)}")
             return None
     
+    @shared_timestamp()
     def batch_get_users(self, uids: List[str]) -> Dict[str, UserProfile]:
         """
         Retrieve multiple users by their UIDs in a batch operation.
@@ -1401,6 +1407,7 @@ class UserManager:
             logger.error(f"Error retrieving users by domain {domain}: {str(e)}")
             raise Exception(f"Failed to retrieve users by domain: {str(e)}")
     
+    @shared_timestamp()
     def get_recent_users(self, days: int = 7, limit: int = 50) -> List[UserProfile]:
         """
         Get recently created users.
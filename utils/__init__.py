@@ -16,6 +16,7 @@ from .validators import (
     validate_qr_payload,
     validate_relationship,
     validate_user_profile_data,
+    validate_users,
     validate_citizen_card_data,
     validate_residence_data,
     validate_household_member_data
@@ -29,7 +30,8 @@ from .models import (
     create_user_profile,
     create_citizen_card,
     create_residence,
-    create_household_member
+    create_household_member,
+    shared_timestamp
 )
 
 from .formatters import (
@@ -84,6 +86,7 @@ __all__ = [
     'validate_qr_payload',
     'validate_relationship',
     'validate_user_profile_data',
+    'validate_users',
     'validate_citizen_card_data',
     'validate_residence_data',
     'validate_household_member_data',
@@ -97,6 +100,7 @@ __all__ = [
     'create_citizen_card',
     'create_residence',
     'create_household_member',
+    'shared_timestamp',
     
     # Formatters
     'format_phone_number',
@@ -26,6 +26,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the simple field validators
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_SEPARATORS_RE = re.compile(r'[\s\-\(\)\+]')
+_WHITESPACE_RE = re.compile(r'\s')
+
 
 class ErrorType(Enum):
     """Enumeration of error types for categorized handling."""
@@ -596,7 +601,7 @@ def validate_and_show_errors(validation_func: Callable,
         
         if isinstance(result, dict):
             is_valid = result.get('valid', False)
-            errors = result.get('errors', [])
+            errors = result.get('errors') or []
         elif isinstance(result, bool):
             is_valid = result
             errors = [] if result else [f"Invalid {field_name}"]
@@ -735,14 +740,13 @@ def validate_user_input(data: Dict[str, Any], required_fields: List[str],
 
 def validate_email(email: str) -> bool:
     """Validate email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_phone(phone: str) -> bool:
     """Validate phone number format."""
     # Remove common separators and plus sign
-    clean_phone = re.sub(r'[\s\-\(\)\+]', '', phone)
+    clean_phone = _PHONE_SEPARATORS_RE.sub('', phone)
     # Check if it's all digits and reasonable length
     return clean_phone.isdigit() and 10 <= len(clean_phone) <= 15
 
@@ -750,7 +754,7 @@ def validate_phone(phone: str) -> bool:
 def validate_citizen_id(citizen_id: str) -> bool:
     """Validate citizen ID format."""
     # Remove spaces and check if it's alphanumeric with reasonable length
-    clean_id = re.sub(r'\s', '', citizen_id)
+    clean_id = _WHITESPACE_RE.sub('', citizen_id)
     return clean_id.isalnum() and 8 <= len(clean_id) <= 20
 
 
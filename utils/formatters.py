@@ -7,6 +7,13 @@ from datetime import datetime
 from typing import Any, Optional, Dict, List
 import re
 
+# Characters not allowed in filenames
+_FILENAME_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Precompiled patterns for stripping phone and citizen ID separators
+_NON_PHONE_CHARS_RE = re.compile(r'[^\d+]')
+_NON_DIGITS_RE = re.compile(r'\D')
+
 
 def format_phone_number(phone: str) -> str:
     """Format phone number for display."""
@@ -14,7 +21,7 @@ def format_phone_number(phone: str) -> str:
         return ""
     
     # Remove all non-digit characters except +
-    clean_phone = re.sub(r'[^\d+]', '', phone)
+    clean_phone = _NON_PHONE_CHARS_RE.sub('', phone)
     
     # Format Vietnamese phone numbers
     if clean_phone.startswith('+84'):
@@ -40,7 +47,7 @@ def format_citizen_id(citizen_id: str) -> str:
         return ""
     
     # Format as XXX XXX XXX XXX for 12-digit IDs
-    clean_id = re.sub(r'\D', '', citizen_id)
+    clean_id = _NON_DIGITS_RE.sub('', citizen_id)
     if len(clean_id) == 12:
         return f"{clean_id[0:3]} {clean_id[3:6]} {clean_id[6:9]} {clean_id[9:12]}"
     
@@ -91,12 +98,11 @@ def format_address(address: str, max_length: int = None) -> str:
     if not address:
         return ""
     
-    formatted_address = address.strip()
+    address = address.strip()
+    if not max_length or len(address) <= max_length:
+        return address
     
-    if max_length and len(formatted_address) > max_length:
-        return formatted_address[:max_length-3] + "..."
-    
-    return formatted_address
+    return address[:max_length - 3] + "..."
 
 
 def format_qr_payload_display(qr_payload: Optional[str], uid: str) -> str:
@@ -194,7 +200,11 @@ def format_time_ago(datetime_obj: Optional[datetime]) -> str:
 
 def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     """Truncate text to specified length with suffix."""
-    if not text or len(text) <= max_length:
+    if not text:
+        return text
+    
+    length = len(text)
+    if length <= max_length:
         return text
     
     return text[:max_length - len(suffix)] + suffix
@@ -224,21 +234,15 @@ def format_currency(amount: float, currency: str = "VND") -> str:
     """Format currency amount."""
     if currency == "VND":
         return f"{amount:,.0f} ₫"
-    else:
-        return f"{amount:,.2f} {currency}"
+    return f"{amount:,.2f} {currency}"
 
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file operations."""
-    # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove leading/trailing spaces and dots
-    sanitized = sanitized.strip(' .')
+    # Replace invalid characters and remove leading/trailing spaces and dots
+    sanitized = _FILENAME_INVALID_CHARS_RE.sub('_', filename).strip(' .')
     # Limit length
-    if len(sanitized) > 255:
-        sanitized = sanitized[:255]
-    
-    return sanitized
+    return sanitized[:255]
 
 
 def format_search_highlight(text: str, search_term: str) -> str:
@@ -246,9 +250,27 @@ def format_search_highlight(text: str, search_term: str) -> str:
     if not search_term or not text:
         return text
     
-    # Simple highlighting - replace with bold markdown
-    pattern = re.compile(re.escape(search_term), re.IGNORECASE)
-    return pattern.sub(f"**{search_term}**", text)
+    folded_text = text.casefold()
+    folded_term = search_term.casefold()
+    if len(folded_text) != len(text):
+        # Case folding changed offsets (e.g. "ß" -> "ss"); fall back to regex
+        pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+        return pattern.sub(lambda match: f"**{match.group(0)}**", text)
+    
+    # Bold each case-insensitive match, keeping the original casing
+    parts = []
+    start = 0
+    term_length = len(folded_term)
+    while True:
+        index = folded_text.find(folded_term, start)
+        if index < 0:
+            parts.append(text[start:])
+            break
+        parts.append(text[start:index])
+        parts.append(f"**{text[index:index + term_length]}**")
+        start = index + term_length
+    
+    return "".join(parts)
 
 
 def format_validation_errors(errors: List[str]) -> str:
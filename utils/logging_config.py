@@ -5,12 +5,24 @@ This module provides comprehensive logging configuration with file rotation,
 structured logging, and error tracking for compliance and debugging.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
 import json
+import queue
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+
+# Number of records buffered in memory before the audit log is flushed
+BUFFER_CAPACITY = 256
+
+# Seconds the oldest buffered audit record may wait before the buffer is flushed
+BUFFER_MAX_AGE = 5.0
+
+# Optional record attributes (passed via ``extra``) copied into structured logs
+_EXTRA_FIELDS = ('user_id', 'admin_email', 'operation', 'error_type')
 
 
 class StructuredFormatter(logging.Formatter):
@@ -18,31 +30,88 @@ class StructuredFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
-        log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+        fields = record.__dict__
+        return json.dumps({
+            # Time the record was logged, not when a buffer happened to flush it
+            'timestamp': datetime.utcfromtimestamp(record.created).isoformat(),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
             'module': record.module,
             'function': record.funcName,
-            'line': record.lineno
-        }
-        
-        # Add exception info if present
-        if record.exc_info:
-            log_data['exception'] = self.formatException(record.exc_info)
-        
-        # Add extra fields if present
-        if hasattr(record, 'user_id'):
-            log_data['user_id'] = record.user_id
-        if hasattr(record, 'admin_email'):
-            log_data['admin_email'] = record.admin_email
-        if hasattr(record, 'operation'):
-            log_data['operation'] = record.operation
-        if hasattr(record, 'error_type'):
-            log_data['error_type'] = record.error_type
-        
-        return json.dumps(log_data, default=str)
+            'line': record.lineno,
+            # Add exception info if present
+            **({'exception': self.formatException(record.exc_info)} if record.exc_info else {}),
+            # Add extra fields if present
+            **{key: fields[key] for key in _EXTRA_FIELDS if key in fields}
+        }, default=str)
+
+
+class SizeTrackingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that tracks the file size itself.
+    
+    The stdlib handler formats each record twice (once in shouldRollover,
+    once when writing) and calls stream.tell() per record. This handler
+    formats once and keeps a running byte count instead.
+    """
+    
+    def __init__(self, filename: str, *args, **kwargs):
+        kwargs.setdefault('encoding', 'utf-8')
+        super().__init__(filename, *args, **kwargs)
+        self._bytes_written = (
+            os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        )
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record, rolling over first if it would exceed maxBytes."""
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode('utf-8'))
+            if self.maxBytes > 0 and self._bytes_written + size >= self.maxBytes:
+                self.doRollover()
+                self._bytes_written = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self.flush()
+            self._bytes_written += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    Memory handler that also flushes once its oldest record is max_age seconds old.
+    
+    The age is checked when a record arrives, so a record logged during a quiet
+    period stays buffered until the next record or interpreter shutdown. That
+    delay is accepted for INFO records; WARNING and above flush immediately.
+    """
+    
+    def __init__(self, capacity: int, max_age: float, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.max_age = max_age
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Flush when full, at flushLevel, or when the buffer has grown stale."""
+        return (
+            super().shouldFlush(record)
+            or record.created - self.buffer[0].created >= self.max_age
+        )
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for in-process listeners that keeps exception info intact."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message arguments without pre-formatting the record."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 class DashboardLogger:
@@ -56,6 +125,7 @@ class DashboardLogger:
             log_dir: Directory to store log files
         """
         self.log_dir = log_dir
+        self._listeners: List[logging.handlers.QueueListener] = []
         # On Windows, file logging often crashes with Streamlit due to locking.
         # Defaulting to console only for stability.
         self.use_file_logging = os.name != 'nt' 
@@ -76,6 +146,7 @@ class DashboardLogger:
         
         # Clear existing handlers
         root_logger.handlers.clear()
+        self.stop_listeners()
         
         # Console handler for development
         console_handler = logging.StreamHandler()
@@ -92,25 +163,26 @@ class DashboardLogger:
         # File handler for general application logs
         try:
             app_log_file = os.path.join(self.log_dir, 'dashboard.log')
-            app_handler = logging.handlers.RotatingFileHandler(
+            app_handler = SizeTrackingRotatingFileHandler(
                 app_log_file,
                 maxBytes=10*1024*1024,  # 10MB
                 backupCount=5
             )
             app_handler.setLevel(logging.INFO)
             app_handler.setFormatter(console_formatter)
-            root_logger.addHandler(app_handler)
             
             # Error-specific handler with structured logging
             error_log_file = os.path.join(self.log_dir, 'errors.log')
-            error_handler = logging.handlers.RotatingFileHandler(
+            error_handler = SizeTrackingRotatingFileHandler(
                 error_log_file,
                 maxBytes=5*1024*1024,  # 5MB
                 backupCount=10
             )
             error_handler.setLevel(logging.ERROR)
             error_handler.setFormatter(StructuredFormatter())
-            root_logger.addHandler(error_handler)
+            root_logger.addHandler(
+                self._queued(app_handler, error_handler)
+            )
         except PermissionError:
             print("WARNING: Could not set up file logging due to permissions. Using console only.")
         except Exception as e:
@@ -119,7 +191,7 @@ class DashboardLogger:
         # Audit log handler for compliance
         try:
             audit_log_file = os.path.join(self.log_dir, 'audit.log')
-            audit_handler = logging.handlers.RotatingFileHandler(
+            audit_handler = SizeTrackingRotatingFileHandler(
                 audit_log_file,
                 maxBytes=20*1024*1024,  # 20MB
                 backupCount=20
@@ -130,12 +202,63 @@ class DashboardLogger:
             # Create audit logger
             audit_logger = logging.getLogger('audit')
             audit_logger.setLevel(logging.INFO)
-            audit_logger.addHandler(audit_handler)
+            audit_logger.handlers.clear()
+            audit_logger.addHandler(self._queued(self._buffered(audit_handler)))
             audit_logger.propagate = False  # Don't propagate to root logger
         except Exception:
              # If audit logging fails, disable it or log to root (console)
              pass
     
+    def _buffered(self, target: logging.Handler) -> TimedMemoryHandler:
+        """
+        Wrap a file handler so records are written in batches.
+        
+        Records are flushed to the target once the buffer is full, when a
+        WARNING or higher record arrives, when the oldest buffered record is
+        BUFFER_MAX_AGE seconds old, or at interpreter shutdown.
+        
+        Args:
+            target: Handler that performs the actual file writes
+            
+        Returns:
+            TimedMemoryHandler buffering records for the target
+        """
+        memory_handler = TimedMemoryHandler(
+            BUFFER_CAPACITY,
+            BUFFER_MAX_AGE,
+            flushLevel=logging.WARNING,
+            target=target
+        )
+        memory_handler.setLevel(target.level)
+        atexit.register(memory_handler.flush)
+        return memory_handler
+    
+    def _queued(self, *handlers: logging.Handler) -> logging.handlers.QueueHandler:
+        """
+        Move file I/O for the given handlers onto a background thread.
+        
+        Logging calls only enqueue the record; a QueueListener thread
+        performs formatting, rotation and writes.
+        
+        Args:
+            handlers: Handlers that should receive records from the queue
+            
+        Returns:
+            QueueHandler feeding the started listener
+        """
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        self._listeners.append(listener)
+        return LocalQueueHandler(log_queue)
+    
+    def stop_listeners(self) -> None:
+        """Stop background listeners, writing out any queued records."""
+        while self._listeners:
+            self._listeners.pop().stop()
+    
     def log_user_operation(self, operation: str, user_id: str, admin_email: str, 
                           details: Dict[str, Any] = None, success: bool = True) -> None:
         """
@@ -236,6 +359,7 @@ class DashboardLogger:
 
 # Global logger instance
 dashboard_logger = DashboardLogger()
+atexit.register(dashboard_logger.stop_listeners)
 
 
 # Convenience functions for logging
@@ -3,15 +3,129 @@ Data models for the Firebase Admin Dashboard.
 Aligns with mobile app Firestore schema.
 """
 
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-import uuid
+from typing import Final, Iterable, Iterator, Optional, List, Dict, Any, Tuple
+import os
+import sys
+
+DEFAULT_PASSCODE: Final = "789789"
+_GENDER_DEFAULT: Final = sys.intern("Nam")
+_NATIONALITY_DEFAULT: Final = sys.intern("Việt Nam")
+_IDENTITY_LEVEL_DEFAULT: Final = 2
+
+# Low-cardinality string fields interned on load so repeated values share one object
+_INTERNED_FIELDS: Final[Tuple[str, ...]] = (
+    'gender', 'nationality', 'ethnicity', 'religion', 'blood_type', 'relation_to_head',
+)
+
+# Timestamp shared by all models created within one request (see shared_timestamp)
+_NOW: ContextVar[datetime] = ContextVar('_now')
+
+
+def _now() -> datetime:
+    """Return the current request timestamp, or the current UTC time outside a request."""
+    try:
+        return _NOW.get()
+    except LookupError:
+        return datetime.utcnow()
+
+
+def _ddmmyyyy(value: datetime) -> str:
+    """Format a date as DD/MM/YYYY without going through strftime."""
+    return f"{value.day:02d}/{value.month:02d}/{value.year:04d}"
+
+
+def _new_member_id() -> str:
+    """Return a random (version 4) UUID string without building a uuid.UUID object."""
+    h = os.urandom(16).hex()
+    variant = '89ab'[int(h[16], 16) & 3]
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}"
+
+
+@contextmanager
+def shared_timestamp() -> Iterator[datetime]:
+    """
+    Use a single UTC timestamp for model defaults within the block.
+    
+    Loading a page of Firestore documents otherwise calls utcnow() for every
+    created_at/updated_at default. Can also be used as a decorator.
+    """
+    token = _NOW.set(datetime.utcnow())
+    try:
+        yield _NOW.get()
+    finally:
+        _NOW.reset(token)
+
+
+# Legacy document keys mapped to their current field names
+_USER_PROFILE_LEGACY_KEYS: Final[Dict[str, str]] = {
+    'name': 'full_name',
+    'phone': 'phone_number',
+    'dob': 'date_of_birth',
+}
+
+_HOUSEHOLD_MEMBER_LEGACY_KEYS: Final[Dict[str, str]] = {
+    'name': 'full_name',
+    'citizen_id': 'id_number',
+    'dob': 'birth_date',
+    'relationship': 'relation_to_head',
+}
 
-DEFAULT_PASSCODE = "789789"
 
+def _canonical_kwargs(data: Dict[str, Any], legacy_keys: Dict[str, str],
+                      field_names: Iterable[str]) -> Dict[str, Any]:
+    """
+    Build constructor kwargs from a Firestore document.
+    
+    Keeps only keys that are model fields, fills current field names
+    from legacy keys when the current key is absent, and interns
+    low-cardinality string values.
+    """
+    kwargs = {key: data[key] for key in data.keys() & field_names}
+    for legacy_key, key in legacy_keys.items():
+        if legacy_key in data and key not in kwargs:
+            kwargs[key] = data[legacy_key]
+    for key in _INTERNED_FIELDS:
+        value = kwargs.get(key)
+        if type(value) is str:
+            kwargs[key] = sys.intern(value)
+    return kwargs
 
-@dataclass
+
+def _get_interned(data: Dict[str, Any], key: str, default: Any) -> Any:
+    """Return data.get(key, default), interning string values."""
+    value = data.get(key, default)
+    return sys.intern(value) if type(value) is str else value
+
+
+def _field_aliases(aliases: Dict[str, str]):
+    """
+    Class decorator exposing legacy attribute names (backward compat).
+    
+    Each alias reuses the slot descriptor of its field, so reads and writes
+    go straight to the same slot without a property call.
+    """
+    def decorate(cls):
+        for alias, field_name in aliases.items():
+            setattr(cls, alias, cls.__dict__[field_name])
+        return cls
+    return decorate
+
+
+# Residence fields only written when set
+_RESIDENCE_OPTIONAL_FIELDS: Final[Tuple[str, ...]] = (
+    'ethnicity', 'religion', 'nationality', 'hometown', 'citizen_status',
+    'temporary_address', 'temporary_start', 'temporary_end', 'qr_payload',
+)
+
+
+@_field_aliases(_USER_PROFILE_LEGACY_KEYS)
+@dataclass(slots=True)
 class UserProfile:
     """User profile - matches Firestore users/{uid}"""
     
@@ -23,10 +137,10 @@ class UserProfile:
     passcode: str = DEFAULT_PASSCODE
     
     # Core Identity Fields
-    identity_level: int = 2
+    identity_level: int = _IDENTITY_LEVEL_DEFAULT
     date_of_birth: str = "" # DD/MM/YYYY
-    gender: str = "Nam"
-    nationality: str = "Việt Nam"
+    gender: str = _GENDER_DEFAULT
+    nationality: str = _NATIONALITY_DEFAULT
     
     # Address Fields
     permanent_address: str = ""
@@ -47,8 +161,8 @@ class UserProfile:
     qr_id_detail: str = ""
     qr_residence: str = ""
     
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to Firestore document."""
@@ -88,7 +202,11 @@ class UserProfile:
         # Handle date_of_birth legacy mapping
         dob = data.get('date_of_birth', data.get('dob', ''))
         if isinstance(dob, datetime):
-            dob = dob.strftime('%d/%m/%Y')
+            dob = _ddmmyyyy(dob)
+        
+        # Missing or null timestamps fall back to the request timestamp
+        created_at = data.get('created_at')
+        updated_at = data.get('updated_at')
             
         return cls(
             uid=data.get('uid', ''),
@@ -98,10 +216,10 @@ class UserProfile:
             citizen_id=data.get('citizen_id', ''),
             passcode=data.get('passcode', DEFAULT_PASSCODE),
             
-            identity_level=data.get('identity_level', 2),
+            identity_level=data.get('identity_level', _IDENTITY_LEVEL_DEFAULT),
             date_of_birth=dob,
-            gender=data.get('gender', 'Nam'),
-            nationality=data.get('nationality', 'Việt Nam'),
+            gender=_get_interned(data, 'gender', _GENDER_DEFAULT),
+            nationality=_get_interned(data, 'nationality', _NATIONALITY_DEFAULT),
             
             permanent_address=data.get('permanent_address', ''),
             current_address=data.get('current_address', ''),
@@ -117,24 +235,17 @@ class UserProfile:
             qr_id_detail=data.get('qr_id_detail', ''),
             qr_residence=data.get('qr_residence', ''),
             
-            created_at=data.get('created_at', datetime.utcnow()),
-            updated_at=data.get('updated_at', datetime.utcnow()),
+            created_at=created_at if created_at is not None else _now(),
+            updated_at=updated_at if updated_at is not None else _now(),
         )
     
-    @property
-    def name(self) -> str:
-        return self.full_name
-        
-    @property
-    def dob(self) -> str:
-        return self.date_of_birth
-    
-    @property
-    def phone(self) -> str:
-        return self.phone_number
+    @classmethod
+    def from_many(cls, docs: Iterable[Dict[str, Any]]) -> List['UserProfile']:
+        """Create profiles from many Firestore documents in one pass."""
+        return list(map(cls.from_dict, docs))
 
 
-@dataclass
+@dataclass(slots=True)
 class CitizenCard:
     """Citizen card - matches Firestore citizen_cards/{uid}"""
     
@@ -142,8 +253,8 @@ class CitizenCard:
     citizen_id: str = ""
     full_name: str = ""
     date_of_birth: str = "" # DD/MM/YYYY
-    gender: str = "Nam"
-    nationality: str = "Việt Nam"
+    gender: str = _GENDER_DEFAULT
+    nationality: str = _NATIONALITY_DEFAULT
     
     # Location info
     birthplace: str = "" # Place of Birth
@@ -168,7 +279,7 @@ class CitizenCard:
     
     # Meta
     qr_code_data: str = ""
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=_now)
     last_updated_at: str = "" # String timestamp for display/sync if needed
     
     def to_dict(self) -> Dict[str, Any]:
@@ -197,7 +308,7 @@ class CitizenCard:
             'issue_place': self.issue_place,
             'qr_code_data': self.qr_code_data,
             'updated_at': self.updated_at,
-            'last_updated_at': self.last_updated_at or self.updated_at.strftime("%d/%m/%Y")
+            'last_updated_at': self.last_updated_at or _ddmmyyyy(self.updated_at)
         }
         return data
     
@@ -207,18 +318,21 @@ class CitizenCard:
         
         # Handle date conversions if legacy data (datetime -> str)
         dob = data.get('date_of_birth', '')
-        if isinstance(dob, datetime): dob = dob.strftime('%d/%m/%Y')
+        if isinstance(dob, datetime): dob = _ddmmyyyy(dob)
         
         issue = data.get('issue_date', '')
-        if isinstance(issue, datetime): issue = issue.strftime('%d/%m/%Y')
+        if isinstance(issue, datetime): issue = _ddmmyyyy(issue)
+        
+        # Missing or null timestamps fall back to the request timestamp
+        updated_at = data.get('updated_at')
         
         return cls(
             uid=data.get('uid', ''),
             citizen_id=data.get('citizen_id', ''),
             full_name=data.get('full_name', ''),
             date_of_birth=dob,
-            gender=data.get('gender', 'Nam'),
-            nationality=data.get('nationality', 'Việt Nam'),
+            gender=_get_interned(data, 'gender', _GENDER_DEFAULT),
+            nationality=_get_interned(data, 'nationality', _NATIONALITY_DEFAULT),
             birthplace=data.get('birthplace', data.get('place_of_birth', '')),
             birth_registration_place=data.get('birth_registration_place', ''),
             hometown=data.get('hometown', ''),
@@ -226,21 +340,23 @@ class CitizenCard:
             permanent_address_2=data.get('permanent_address_2', ''),
             temporary_address=data.get('temporary_address', ''),
             current_address=data.get('current_address', ''),
-            ethnicity=data.get('ethnicity', ''),
-            religion=data.get('religion', ''),
+            ethnicity=_get_interned(data, 'ethnicity', ''),
+            religion=_get_interned(data, 'religion', ''),
             identifying_marks=data.get('identifying_marks', data.get('personal_identification', '')),
-            blood_type=data.get('blood_type', ''),
+            blood_type=_get_interned(data, 'blood_type', ''),
             profession=data.get('profession', ''),
             other_info=data.get('other_info', ''),
             issue_date=issue,
             issue_place=data.get('issue_place', data.get('issuing_authority', '')),
             qr_code_data=data.get('qr_code_data', data.get('qr_payload', '')),
-            updated_at=data.get('updated_at', datetime.utcnow()),
-            last_updated_at=data.get('last_updated_at', datetime.utcnow().strftime("%d/%m/%Y"))
+            updated_at=updated_at if updated_at is not None else _now(),
+            last_updated_at=(data['last_updated_at'] if 'last_updated_at' in data
+                             else _ddmmyyyy(_now())),
         )
 
 
-@dataclass
+@_field_aliases(_HOUSEHOLD_MEMBER_LEGACY_KEYS)
+@dataclass(slots=True)
 class HouseholdMember:
     """Household member - matches residence/{uid}/household_members/{memberId}"""
     
@@ -254,7 +370,7 @@ class HouseholdMember:
     
     def __post_init__(self):
         if not self.member_id:
-            self.member_id = str(uuid.uuid4())
+            self.member_id = _new_member_id()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to Firestore document format per schema."""
@@ -273,32 +389,14 @@ class HouseholdMember:
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'HouseholdMember':
-        # Handle both old and new schema keys
-        return cls(
-            member_id=data.get('member_id', str(uuid.uuid4())), # Not in schema body but needed for app logic
-            full_name=data.get('full_name', data.get('name', '')),
-            id_number=data.get('id_number', data.get('citizen_id', '')),
-            birth_date=data.get('birth_date', data.get('dob', '')),
-            gender=data.get('gender', ''),
-            relation_to_head=data.get('relation_to_head', data.get('relationship', '')),
-            citizen_status=data.get('citizen_status'),
-        )
-    
-    # Backward compat
-    @property
-    def name(self) -> str:
-        return self.full_name
-    
-    @property
-    def relationship(self) -> str:
-        return self.relation_to_head
-    
-    @property
-    def citizen_id(self) -> str:
-        return self.id_number
+        # Handle both old and new schema keys; member_id is not in the schema body
+        # but needed for app logic, and is generated in __post_init__ when missing
+        return cls(**_canonical_kwargs(
+            data, _HOUSEHOLD_MEMBER_LEGACY_KEYS, cls.__dataclass_fields__.keys()
+        ))
 
 
-@dataclass
+@dataclass(slots=True)
 class Residence:
     """Residence - matches Firestore residence/{uid}"""
     
@@ -329,7 +427,7 @@ class Residence:
     
     # Old/Internal fields
     qr_payload: Optional[str] = None
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=_now)
     household_members: List[HouseholdMember] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -349,70 +447,33 @@ class Residence:
         }
         
         # Optional fields
-        for key in ['ethnicity', 'religion', 'nationality', 'hometown', 'citizen_status',
-                   'temporary_address', 'temporary_start', 'temporary_end', 'qr_payload']:
+        for key in _RESIDENCE_OPTIONAL_FIELDS:
             val = getattr(self, key)
             if val:
                 data[key] = val
                 
         return data
-    
-        if members is None and 'household_members' in data:
-            # Try to parse members from data if provided as list of dicts
-            raw_members = data.get('household_members', [])
-            members = []
-            for m in raw_members:
-                if isinstance(m, dict):
-                    members.append(HouseholdMember.from_dict(m))
-                elif isinstance(m, HouseholdMember):
-                    members.append(m)
-                    
-        return cls(
-            uid=data.get('uid', ''), # Internal, often document ID
-            full_name=data.get('full_name', ''),
-            id_number=data.get('id_number', data.get('citizen_id', '')),
-            birth_date=data.get('birth_date', ''),
-            gender=data.get('gender', ''),
-            
-            permanent_address=data.get('permanent_address', ''),
-            current_address=data.get('current_address', ''),
-            temporary_address=data.get('temporary_address'),
-            temporary_start=data.get('temporary_start'),
-            temporary_end=data.get('temporary_end'),
-            
-            ethnicity=data.get('ethnicity'),
-            religion=data.get('religion'),
-            nationality=data.get('nationality'),
-            hometown=data.get('hometown'),
-            citizen_status=data.get('citizen_status'),
-            
-            household_head_name=data.get('household_head_name', data.get('head_of_household', '')),
-            household_head_id=data.get('household_head_id', ''),
-            relation_to_head=data.get('relation_to_head', data.get('relationship_to_head', '')),
-            
-            qr_payload=data.get('qr_payload'),
-            updated_at=data.get('updated_at', datetime.utcnow()),
-            household_members=members or [],
-        )
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Residence':
+    def from_dict(cls, data: Dict[str, Any],
+                  _member_from_dict=HouseholdMember.from_dict) -> 'Residence':
         """Create from Firestore document."""
         # Handle household members if list of dicts
-        members = []
-        raw_members = data.get('household_members', [])
-        for m in raw_members:
-            if isinstance(m, dict):
-                members.append(HouseholdMember.from_dict(m))
-            elif isinstance(m, HouseholdMember):
-                members.append(m)
+        members = [
+            m if isinstance(m, HouseholdMember) else _member_from_dict(m)
+            for m in data.get('household_members', ())
+            if isinstance(m, (dict, HouseholdMember))
+        ]
+
+        # Missing or null timestamp falls back to the request timestamp
+        updated_at = data.get('updated_at')
 
         return cls(
             uid=data.get('uid', ''),
             full_name=data.get('full_name', ''),
             id_number=data.get('id_number', data.get('citizen_id', '')),
             birth_date=data.get('birth_date', ''),
-            gender=data.get('gender', ''),
+            gender=_get_interned(data, 'gender', ''),
             
             permanent_address=data.get('permanent_address', ''),
             current_address=data.get('current_address', ''),
@@ -420,18 +481,20 @@ class Residence:
             temporary_start=data.get('temporary_start'),
             temporary_end=data.get('temporary_end'),
             
-            ethnicity=data.get('ethnicity'),
-            religion=data.get('religion'),
-            nationality=data.get('nationality'),
+            ethnicity=_get_interned(data, 'ethnicity', None),
+            religion=_get_interned(data, 'religion', None),
+            nationality=_get_interned(data, 'nationality', None),
             hometown=data.get('hometown'),
             citizen_status=data.get('citizen_status'),
             
             household_head_name=data.get('household_head_name', data.get('head_of_household', '')),
             household_head_id=data.get('household_head_id', ''),
-            relation_to_head=data.get('relation_to_head', data.get('relationship_to_head', '')),
+            relation_to_head=_get_interned(
+                data, 'relation_to_head', data.get('relationship_to_head', '')
+            ),
             
             qr_payload=data.get('qr_payload'),
-            updated_at=data.get('updated_at', datetime.utcnow()),
+            updated_at=updated_at if updated_at is not None else _now(),
             household_members=members,
         )
 
@@ -466,7 +529,7 @@ def create_residence(uid: str, full_name: str = "", citizen_id: str = "",
     return Residence(
         uid=uid,
         full_name=full_name,
-        citizen_id=citizen_id,
+        id_number=citizen_id,
         permanent_address=permanent_address,
         current_address=current_address,
         **kwargs
@@ -477,7 +540,7 @@ def create_household_member(full_name: str = "", relation_to_head: str = "",
                            member_id: str = None, **kwargs) -> HouseholdMember:
     """Create a new HouseholdMember instance."""
     return HouseholdMember(
-        member_id=member_id or str(uuid.uuid4()),
+        member_id=member_id or _new_member_id(),
         full_name=full_name,
         relation_to_head=relation_to_head,
         **kwargs
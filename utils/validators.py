@@ -4,16 +4,81 @@ Provides comprehensive validation functions for all user data types.
 """
 
 import re
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+from functools import lru_cache, partial
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple, Union
 from email_validator import validate_email, EmailNotValidError
 
+# Precompiled pattern for names
+_NAME_RE = re.compile(r'^[a-zA-ZÀ-ỹ\s\.\-\']+$')
+
+# DD/MM/YYYY shape (ASCII digits only)
+_DATE_RE = re.compile(r'^\d{2}/\d{2}/\d{4}$', re.ASCII)
+
+# Cheap shape test run before email_validator: one @, no whitespace, and a dot in
+# the domain. email_validator also treats U+3002, U+FF0E and U+FF61 as domain dots.
+_EMAIL_SHAPE_RE = re.compile(r'\A[^@\s]+@[^@\s]+[.\u3002\uff0e\uff61][^@\s]+\Z')
+
+# ASCII characters _NAME_RE accepts, for a regex-free check of unaccented names
+_NAME_ASCII_CHARS = frozenset(c for c in map(chr, range(128)) if _NAME_RE.match(c))
+
+# Allowed values (tuples keep the order used in error messages)
+_GENDERS = ("Male", "Female", "Other", "Nam", "Nữ", "Khác")
+_VALID_GENDERS = frozenset(_GENDERS)
+
+_RELATIONSHIPS = (
+    "Head", "Spouse", "Child", "Parent", "Sibling", "Grandparent",
+    "Grandchild", "Other", "Chủ hộ", "Vợ/Chồng", "Con", "Cha/Mẹ",
+    "Anh/Chị/Em", "Ông/Bà", "Cháu", "Khác"
+)
+_VALID_RELATIONSHIPS = frozenset(_RELATIONSHIPS)
+
+# Oldest accepted date of birth is now - _MAX_AGE (150 years of 365.25 days)
+_MAX_AGE = timedelta(days=54788)
+
+# Shared results for fixed outcomes. Callers must treat results as read-only.
+_VALID = {"valid": True}
+# Passing records share one result; its errors are an immutable tuple, so the
+# list-returning wrappers (validate_user_profile etc.) substitute a fresh [].
+_VALID_RECORD = {"valid": True, "errors": ()}
+_ERR_EMAIL_REQUIRED = {"valid": False, "error": "Email là bắt buộc"}
+_ERR_EMAIL_FORMAT = {"valid": False, "error": "Email không đúng định dạng"}
+_ERR_PHONE_REQUIRED = {"valid": False, "error": "Số điện thoại là bắt buộc"}
+_ERR_CITIZEN_ID_REQUIRED = {"valid": False, "error": "Số CCCD là bắt buộc"}
+_ERR_CITIZEN_ID_FORMAT = {"valid": False, "error": "Số CCCD phải có đúng 12 chữ số"}
+_ERR_PASSCODE_REQUIRED = {"valid": False, "error": "Mã bảo mật là bắt buộc"}
+_ERR_PASSCODE_FORMAT = {"valid": False, "error": "Mã bảo mật phải từ 4-6 số"}
+_ERR_NAME_REQUIRED = {"valid": False, "error": "Họ và tên là bắt buộc"}
+_ERR_NAME_TOO_SHORT = {"valid": False, "error": "Tên phải có ít nhất 2 ký tự"}
+_ERR_NAME_CHARS = {"valid": False, "error": "Tên chứa ký tự không hợp lệ"}
+_ERR_DOB_REQUIRED = {"valid": False, "error": "Ngày sinh là bắt buộc"}
+_ERR_DOB_FUTURE = {"valid": False, "error": "Ngày sinh không thể ở tương lai"}
+_ERR_DOB_TOO_OLD = {"valid": False, "error": "Ngày sinh quá xa trong quá khứ"}
+_ERR_ADDRESS_REQUIRED = {"valid": False, "error": "Address is required"}
+_ERR_ADDRESS_TOO_SHORT = {"valid": False, "error": "Address must be at least 5 characters"}
+_ERR_QR_TOO_LONG = {"valid": False, "error": "QR payload is too long (max 500 characters)"}
+_ERR_RELATIONSHIP_REQUIRED = {"valid": False, "error": "Relationship is required"}
+_ERR_RELATIONSHIP = {"valid": False, "error": f"Relationship must be one of: {', '.join(_RELATIONSHIPS)}"}
+_ERR_GENDER = {"valid": False, "error": f"Gender must be one of: {', '.join(_GENDERS)}"}
+_ERR_DATE_FORMAT = {"valid": False, "error": "Invalid format (DD/MM/YYYY)"}
+
 
 def validate_required_field(value: Any, field_name: str) -> Dict[str, Any]:
     """Validate that a required field is not empty."""
-    if value is None or (isinstance(value, str) and not value.strip()):
-        return {"valid": False, "error": f"{field_name} là bắt buộc"}
-    return {"valid": True}
+    if value is None or (type(value) is str and not value.strip()):
+        return _REQUIRED_ERRORS.get(field_name) or {"valid": False, "error": f"{field_name} là bắt buộc"}
+    return _VALID
+
+
+@lru_cache(maxsize=4096)
+def _email_is_valid(email: str) -> bool:
+    """Parse an address once; repeated addresses (edit/save, re-imports) hit the cache."""
+    try:
+        # Use check_deliverability=False to avoid DNS checks for testing
+        validate_email(email, check_deliverability=False)
+        return True
+    except EmailNotValidError:
+        return False
 
 
 def validate_email_field(email: str) -> Dict[str, Any]:
@@ -21,143 +86,156 @@ def validate_email_field(email: str) -> Dict[str, Any]:
     if not email or not email.strip():
         # Optional field usually, but if called it might be required context
         # Adjusting strictly:
-        return {"valid": False, "error": "Email là bắt buộc"}
+        return _ERR_EMAIL_REQUIRED
     
-    try:
-        # Use check_deliverability=False to avoid DNS checks for testing
-        validate_email(email, check_deliverability=False)
-        return {"valid": True}
-    except EmailNotValidError:
-        return {"valid": False, "error": "Email không đúng định dạng"}
+    return _validate_email_nonblank(email)
+
+
+def _validate_email_nonblank(email: str) -> Dict[str, Any]:
+    """Syntax check for an email already known not to be blank (passed unstripped)."""
+    if not _EMAIL_SHAPE_RE.match(email):
+        return _ERR_EMAIL_FORMAT
+    return _VALID if _email_is_valid(email) else _ERR_EMAIL_FORMAT
 
 
 def validate_phone_number(phone: str) -> Dict[str, Any]:
     """Validate phone number (basic required field check only)."""
     if not phone or not phone.strip():
-        return {"valid": False, "error": "Số điện thoại là bắt buộc"}
+        return _ERR_PHONE_REQUIRED
     
-    return {"valid": True}
+    return _VALID
 
 
 def validate_citizen_id(citizen_id: str) -> Dict[str, Any]:
     """Validate Vietnamese citizen ID format."""
-    if not citizen_id or not citizen_id.strip():
-        return {"valid": False, "error": "Số CCCD là bắt buộc"}
-    
-    clean_id = citizen_id.strip()
+    clean_id = citizen_id.strip() if citizen_id else ""
+    if not clean_id:
+        return _ERR_CITIZEN_ID_REQUIRED
     
+    return _validate_citizen_id_stripped(clean_id)
+
+
+def _validate_citizen_id_stripped(clean_id: str) -> Dict[str, Any]:
+    """Format check for an already stripped, non-empty citizen ID."""
     # Vietnamese citizen ID is 12 digits
-    if not re.match(r'^\d{12}$', clean_id):
-        return {"valid": False, "error": "Số CCCD phải có đúng 12 chữ số"}
+    if len(clean_id) != 12 or not clean_id.isdecimal():
+        return _ERR_CITIZEN_ID_FORMAT
     
-    return {"valid": True}
+    return _VALID
 
 
 def validate_passcode(passcode: str) -> Dict[str, Any]:
     """Validate user passcode."""
-    if not passcode or not passcode.strip():
-        return {"valid": False, "error": "Mã bảo mật là bắt buộc"}
-    
-    clean_passcode = passcode.strip()
+    clean_passcode = passcode.strip() if passcode else ""
+    if not clean_passcode:
+        return _ERR_PASSCODE_REQUIRED
     
     # Passcode should be 4-6 digits
-    if not re.match(r'^\d{4,6}$', clean_passcode):
-        return {"valid": False, "error": "Mã bảo mật phải từ 4-6 số"}
+    if not 4 <= len(clean_passcode) <= 6 or not clean_passcode.isdecimal():
+        return _ERR_PASSCODE_FORMAT
     
-    return {"valid": True}
+    return _VALID
 
 
 def validate_name(name: str) -> Dict[str, Any]:
     """Validate person name."""
-    if not name or not name.strip():
-        return {"valid": False, "error": "Họ và tên là bắt buộc"}
-    
-    clean_name = name.strip()
+    clean_name = name.strip() if name else ""
+    if not clean_name:
+        return _ERR_NAME_REQUIRED
     
+    return _validate_name_stripped(clean_name)
+
+
+def _validate_name_stripped(clean_name: str) -> Dict[str, Any]:
+    """Length and character checks for an already stripped, non-empty name."""
     # Name should be at least 2 characters and contain only letters, spaces, and Vietnamese characters
     if len(clean_name) < 2:
-        return {"valid": False, "error": "Tên phải có ít nhất 2 ký tự"}
+        return _ERR_NAME_TOO_SHORT
     
     # Allow Vietnamese characters, letters, spaces, and common punctuation
-    if not re.match(r'^[a-zA-ZÀ-ỹ\s\.\-\']+$', clean_name):
-        return {"valid": False, "error": "Tên chứa ký tự không hợp lệ"}
+    if clean_name.isascii():
+        if not _NAME_ASCII_CHARS.issuperset(clean_name):
+            return _ERR_NAME_CHARS
+    elif not _NAME_RE.match(clean_name):
+        return _ERR_NAME_CHARS
     
-    return {"valid": True}
+    return _VALID
 
 
-def validate_date_of_birth(dob: datetime) -> Dict[str, Any]:
-    """Validate date of birth."""
+def validate_date_of_birth(dob: Union[datetime, date], now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Validate date of birth. Pass ``now`` to reuse one clock read across records."""
     if not dob:
-        return {"valid": False, "error": "Ngày sinh là bắt buộc"}
+        return _ERR_DOB_REQUIRED
     
-    current_date = datetime.now()
+    current_date = now or datetime.now()
+    if not isinstance(dob, datetime):
+        # Plain dates cannot be compared with datetimes
+        current_date = current_date.date()
     
     # Check if date is not in the future
     if dob > current_date:
-        return {"valid": False, "error": "Ngày sinh không thể ở tương lai"}
+        return _ERR_DOB_FUTURE
     
     # Check reasonable age limits (0-150 years)
-    age_years = (current_date - dob).days / 365.25
-    if age_years > 150:
-        return {"valid": False, "error": "Ngày sinh quá xa trong quá khứ"}
+    if dob <= current_date - _MAX_AGE:
+        return _ERR_DOB_TOO_OLD
     
-    return {"valid": True}
+    return _VALID
 
 
 def validate_address(address: str) -> Dict[str, Any]:
     """Validate address field."""
-    if not address or not address.strip():
-        return {"valid": False, "error": "Address is required"}
-    
-    clean_address = address.strip()
+    clean_address = address.strip() if address else ""
+    if not clean_address:
+        return _ERR_ADDRESS_REQUIRED
     
+    return _validate_address_stripped(clean_address)
+
+
+def _validate_address_stripped(clean_address: str) -> Dict[str, Any]:
+    """Length check for an already stripped, non-empty address."""
     if len(clean_address) < 5:
-        return {"valid": False, "error": "Address must be at least 5 characters"}
+        return _ERR_ADDRESS_TOO_SHORT
     
-    return {"valid": True}
+    return _VALID
 
 
 def validate_gender(gender: Optional[str]) -> Dict[str, Any]:
     """Validate gender field."""
     if gender is None:
-        return {"valid": True}  # Optional field
+        return _VALID  # Optional field
     
-    valid_genders = ["Male", "Female", "Other", "Nam", "Nữ", "Khác"]
-    if gender not in valid_genders:
-        return {"valid": False, "error": f"Gender must be one of: {', '.join(valid_genders)}"}
+    if gender not in _VALID_GENDERS:
+        return _ERR_GENDER
     
-    return {"valid": True}
+    return _VALID
 
 
 def validate_qr_payload(qr_payload: Optional[str]) -> Dict[str, Any]:
     """Validate QR payload text."""
-    if qr_payload is None or qr_payload.strip() == "":
-        return {"valid": True}  # Optional field, empty means use uid as fallback
+    if qr_payload is None:
+        return _VALID  # Optional field, empty means use uid as fallback
     
     clean_payload = qr_payload.strip()
+    if not clean_payload:
+        return _VALID
     
     # QR payload should not be too long (reasonable limit for QR codes)
     if len(clean_payload) > 500:
-        return {"valid": False, "error": "QR payload is too long (max 500 characters)"}
+        return _ERR_QR_TOO_LONG
     
-    return {"valid": True}
+    return _VALID
 
 
 def validate_relationship(relationship: str) -> Dict[str, Any]:
     """Validate household member relationship."""
     if not relationship or not relationship.strip():
-        return {"valid": False, "error": "Relationship is required"}
+        return _ERR_RELATIONSHIP_REQUIRED
     
-    valid_relationships = [
-        "Head", "Spouse", "Child", "Parent", "Sibling", "Grandparent", 
-        "Grandchild", "Other", "Chủ hộ", "Vợ/Chồng", "Con", "Cha/Mẹ", 
-        "Anh/Chị/Em", "Ông/Bà", "Cháu", "Khác"
-    ]
+    if relationship not in _VALID_RELATIONSHIPS:
+        return _ERR_RELATIONSHIP
     
-    if relationship not in valid_relationships:
-        return {"valid": False, "error": f"Relationship must be one of: {', '.join(valid_relationships)}"}
-    
-    return {"valid": True}
+    return _VALID
 
 
 def validate_date_string(date_str: str, field_name: str = "Date") -> Dict[str, Any]:
@@ -165,271 +243,270 @@ def validate_date_string(date_str: str, field_name: str = "Date") -> Dict[str, A
     if not date_str:
          return {"valid": False, "error": f"{field_name} is required"}
     
-    if not re.match(r'^\d{2}/\d{2}/\d{4}$', date_str):
+    if not _DATE_RE.match(date_str):
         return {"valid": False, "error": f"{field_name}: Invalid format (DD/MM/YYYY)"}
         
+    # The pattern fixed the layout, so build the date directly instead of
+    # re-parsing with strptime. Reject the trailing newline that $ lets through.
     try:
-        datetime.strptime(date_str, '%d/%m/%Y')
+        if len(date_str) == 10:
+            datetime(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
+            return _VALID
     except ValueError:
-        return {"valid": False, "error": f"{field_name}: Invalid date value"}
-        
-    return {"valid": True}
+        pass
+    
+    return {"valid": False, "error": f"{field_name}: Invalid date value"}
 
 
-def validate_user_profile_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate complete user profile data."""
+# Validators that take the value already stripped by the batch loops, so the
+# string is stripped once per field instead of once per check.
+_TAKES_STRIPPED = frozenset((
+    _validate_citizen_id_stripped,
+    _validate_name_stripped,
+    _validate_address_stripped,
+))
+
+# Required profile fields: (field, legacy alias, format validator).
+# The phone check is presence only, which the required test already covers.
+_PROFILE_REQUIRED_CHECKS = (
+    ('full_name', 'name', None),
+    ('email', None, _validate_email_nonblank),
+    ('phone_number', 'phone', None),
+    ('citizen_id', None, _validate_citizen_id_stripped),
+)
+
+
+def validate_user_profile_data(data: Dict[str, Any], now: Optional[datetime] = None,
+                               fail_fast: bool = False) -> Dict[str, Any]:
+    """
+    Validate complete user profile data.
+    
+    With fail_fast, return as soon as the first error is found so the
+    remaining (costlier) checks such as email parsing are skipped.
+    """
     errors = []
     
-    # Required fields validation
-    required_fields = ['full_name', 'email', 'phone_number', 'citizen_id']
-    for field in required_fields:
-        # Handle aliases
-        val = data.get(field)
-        if val is None:
-            if field == 'full_name': val = data.get('name')
-            elif field == 'phone_number': val = data.get('phone')
+    # Required fields, each looked up once and then format-checked
+    for field, alias, validator in _PROFILE_REQUIRED_CHECKS:
+        value = data.get(field)
+        if value is None and alias:
+            value = data.get(alias)
         
-        result = validate_required_field(val, field)
-        if not result["valid"]:
-            errors.append(result["error"])
-    
-    # Specific field validations
-    email = data.get('email')
-    if email:
-        result = validate_email_field(email)
-        if not result["valid"]:
-            errors.append(result["error"])
-    
-    phone = data.get('phone_number') or data.get('phone')
-    if phone:
-        result = validate_phone_number(phone)
-        if not result["valid"]:
-            errors.append(result["error"])
-    
-    citizen_id = data.get('citizen_id')
-    if citizen_id:
-        result = validate_citizen_id(citizen_id)
-        if not result["valid"]:
-            errors.append(result["error"])
+        # Same test as validate_required_field, inlined for the hot loop
+        if type(value) is str:
+            clean = value.strip()
+            if clean and validator in _TAKES_STRIPPED:
+                value = clean
+        else:
+            clean = value
+        if clean is None or clean == "":
+            errors.append(_REQUIRED_ERRORS[field]["error"])
+            if fail_fast:
+                return {"valid": False, "errors": errors}
+            continue
+        
+        if validator and value:
+            result = validator(value)
+            if not result["valid"]:
+                errors.append(result["error"])
+                if fail_fast:
+                    return {"valid": False, "errors": errors}
     
     # Validate Date of Birth (String or Datetime)
     dob = data.get('date_of_birth') or data.get('dob')
     if dob:
         if isinstance(dob, str):
             result = validate_date_string(dob, "Date of birth")
-        elif isinstance(dob, datetime) or hasattr(dob, 'date'):
+        elif isinstance(dob, (datetime, date)):
              # Accept if it's already a date object (legacy flow support)
-             result = validate_date_of_birth(dob)
+             result = validate_date_of_birth(dob, now)
         else:
              result = {"valid": False, "error": "Date of birth has invalid type"}
              
         if not result["valid"]:
             errors.append(result["error"])
+            if fail_fast:
+                return {"valid": False, "errors": errors}
     else:
         # It's a required field in new schema
         errors.append("Date of birth is required")
+        if fail_fast:
+            return {"valid": False, "errors": errors}
     
     # Validate Address Fields
-    if data.get('permanent_address'):
-        result = validate_address(data['permanent_address'])
+    permanent_address = data.get('permanent_address')
+    if permanent_address:
+        result = validate_address(permanent_address)
         if not result["valid"]:
             errors.append(f"Permanent address: {result['error']}")
+            if fail_fast:
+                return {"valid": False, "errors": errors}
 
-    if data.get('current_address'):
-        result = validate_address(data['current_address'])
+    current_address = data.get('current_address')
+    if current_address:
+        result = validate_address(current_address)
         if not result["valid"]:
             errors.append(f"Current address: {result['error']}")
+            if fail_fast:
+                return {"valid": False, "errors": errors}
 
     # Common generic address check if others missing
-    if not data.get('permanent_address') and not data.get('current_address') and data.get('address'):
-         result = validate_address(data['address'])
-         if not result["valid"]:
-            errors.append(f"Address: {result['error']}")
+    if not permanent_address and not current_address:
+        address = data.get('address')
+        if address:
+            result = validate_address(address)
+            if not result["valid"]:
+                errors.append(f"Address: {result['error']}")
+                if fail_fast:
+                    return {"valid": False, "errors": errors}
 
-    
-    if data.get('gender'):
-        result = validate_gender(data['gender'])
+    gender = data.get('gender')
+    if gender:
+        result = validate_gender(gender)
         if not result["valid"]:
             errors.append(result["error"])
+            if fail_fast:
+                return {"valid": False, "errors": errors}
     
     # QR payload validations
-    for qr_field in ['qr_home', 'qr_card', 'qr_id_detail', 'qr_residence']:
-        if data.get(qr_field):
-            result = validate_qr_payload(data[qr_field])
+    for qr_field in ('qr_home', 'qr_card', 'qr_id_detail', 'qr_residence'):
+        payload = data.get(qr_field)
+        if payload:
+            result = validate_qr_payload(payload)
             if not result["valid"]:
                 errors.append(f"{qr_field}: {result['error']}")
+                if fail_fast:
+                    return {"valid": False, "errors": errors}
     
-    return {"valid": len(errors) == 0, "errors": errors}
+    if not errors:
+        return _VALID_RECORD
+    return {"valid": False, "errors": errors}
 
 
-def validate_citizen_card_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Validate citizen card data against 'Citizen Card Data Guide'.
-    """
-    errors = []
-    
-    # Required fields per guide
-    required_fields = [
-        'full_name', 'citizen_id', 'date_of_birth', 'gender', 'nationality',
-        'birthplace', 'birth_registration_place', 'hometown',
-        'permanent_address', 'current_address', 
-        'identifying_marks', 'issue_date', 'issue_place'
-    ]
-    
-    for field in required_fields:
-        # Handle potential backward compat aliases for validation checks
-        val = data.get(field)
-        if val is None:
-            if field == 'birthplace': val = data.get('place_of_birth')
-            elif field == 'identifying_marks': val = data.get('personal_identification')
-            elif field == 'issue_place': val = data.get('issuing_authority')
-            
-        result = validate_required_field(val, field)
-        if not result["valid"]:
-            errors.append(result["error"])
-    
-    # Specific validations
-    if data.get('full_name'):
-        result = validate_name(data['full_name'])
-        if not result["valid"]:
-             errors.append(f"Full name: {result['error']}")
-    
-    if data.get('citizen_id'):
-        result = validate_citizen_id(data['citizen_id'])
-        if not result["valid"]:
-            errors.append(f"Citizen ID: {result['error']}")
-            
-    # Date validations (String format)
-    for date_field in ['date_of_birth', 'issue_date']:
-        val = data.get(date_field)
-        if val:
-            if isinstance(val, str):
-                result = validate_date_string(val, date_field.replace('_', ' ').title())
-                if not result["valid"]:
-                    errors.append(result["error"])
-            elif isinstance(val, date) or isinstance(val, datetime):
-                 # Allow object types if strict mode off, but warn or pass
-                 pass 
-    
-    if data.get('qr_code_data') or data.get('qr_payload'):
-        val = data.get('qr_code_data') or data.get('qr_payload')
-        result = validate_qr_payload(val)
-        if not result["valid"]:
-            errors.append(f"QR Data: {result['error']}")
-            
-    return {"valid": len(errors) == 0, "errors": errors}
+def validate_users(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate many user profiles against a single reading of the clock."""
+    now = datetime.now()
+    return [validate_user_profile_data(record, now) for record in records]
 
 
-def validate_residence_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate residence data."""
+def _check_date_format(value: Any) -> Dict[str, Any]:
+    """Check the DD/MM/YYYY shape only (no calendar check)."""
+    if not _DATE_RE.match(str(value)):
+        return _ERR_DATE_FORMAT
+    return _VALID
+
+
+def _check_card_date(value: Any, field_name: str) -> Dict[str, Any]:
+    """Card dates: strings must be valid DD/MM/YYYY, date objects pass as-is."""
+    if isinstance(value, str):
+        return validate_date_string(value, field_name)
+    return _VALID
+
+
+def _run_checks(data: Dict[str, Any], schema: Tuple[tuple, ...]) -> Dict[str, Any]:
+    """
+    Validate data against a schema in a single pass.
+    
+    Each schema entry is (field, legacy alias, label, validator, required).
+    The alias is read when the field is absent. A required field that is
+    empty reports "<field> là bắt buộc" and skips its validator; otherwise
+    the validator's error is reported, prefixed with the label if any.
+    """
     errors = []
     
-    # Required fields per Resident Information Data Guide
-    required_fields = [
-        'full_name', 'id_number', 'birth_date', 'gender',
-        'permanent_address', 'current_address', 
-        'household_head_name', 'household_head_id', 'relation_to_head'
-    ]
-    
-    for field in required_fields:
-        # Handle field aliases if old data is passed
-        val = data.get(field)
-        if val is None:
-            if field == 'id_number': val = data.get('citizen_id')
-            elif field == 'household_head_name': val = data.get('head_of_household')
-            elif field == 'household_head_id': val = data.get('head_of_household_id') # Potential alias
-            elif field == 'relation_to_head': val = data.get('relationship_to_head')
+    for field, alias, label, validator, required in schema:
+        value = data.get(field)
+        if value is None and alias:
+            value = data.get(alias)
         
-        result = validate_required_field(val, field)
-        if not result["valid"]:
-            errors.append(result["error"])
-    
-    # Specific validations
-    if data.get('full_name'):
-        result = validate_name(data['full_name'])
-        if not result["valid"]:
-            errors.append(f"Full name: {result['error']}")
+        # Same test as validate_required_field, inlined for the hot loop
+        if type(value) is str:
+            clean = value.strip()
+            if clean and validator in _TAKES_STRIPPED:
+                value = clean
+        else:
+            clean = value
+        if required and (clean is None or clean == ""):
+            errors.append(_REQUIRED_ERRORS[field]["error"])
+            continue
+        
+        if validator and value:
+            result = validator(value)
+            if not result["valid"]:
+                errors.append(f"{label}: {result['error']}" if label else result["error"])
+    
+    if not errors:
+        return _VALID_RECORD
+    return {"valid": False, "errors": errors}
+
+
+# Schemas per 'Citizen Card Data Guide' and 'Resident Information Data Guide'
+_CITIZEN_CARD_SCHEMA = (
+    ('full_name', None, 'Full name', _validate_name_stripped, True),
+    ('citizen_id', None, 'Citizen ID', _validate_citizen_id_stripped, True),
+    ('date_of_birth', None, None, partial(_check_card_date, field_name='Date Of Birth'), True),
+    ('gender', None, None, None, True),
+    ('nationality', None, None, None, True),
+    ('birthplace', 'place_of_birth', None, None, True),
+    ('birth_registration_place', None, None, None, True),
+    ('hometown', None, None, None, True),
+    ('permanent_address', None, None, None, True),
+    ('current_address', None, None, None, True),
+    ('identifying_marks', 'personal_identification', None, None, True),
+    ('issue_date', None, None, partial(_check_card_date, field_name='Issue Date'), True),
+    ('issue_place', 'issuing_authority', None, None, True),
+    ('qr_code_data', 'qr_payload', 'QR Data', validate_qr_payload, False),
+)
+
+_RESIDENCE_SCHEMA = (
+    ('full_name', None, 'Full name', _validate_name_stripped, True),
+    ('id_number', 'citizen_id', 'ID Number', _validate_citizen_id_stripped, True),
+    ('birth_date', None, 'birth_date', _check_date_format, True),
+    ('gender', None, None, None, True),
+    ('permanent_address', None, 'Permanent address', _validate_address_stripped, True),
+    ('current_address', None, 'Current address', _validate_address_stripped, True),
+    ('household_head_name', 'head_of_household', None, None, True),
+    ('household_head_id', 'head_of_household_id', None, None, True),
+    ('relation_to_head', 'relationship_to_head', 'Relation to head', validate_relationship, True),
+    ('temporary_start', None, 'temporary_start', _check_date_format, False),
+    ('temporary_end', None, 'temporary_end', _check_date_format, False),
+)
+
+# Note: Schema says id_number, birth_date, gender are required
+_HOUSEHOLD_MEMBER_SCHEMA = (
+    ('full_name', 'name', 'Name', _validate_name_stripped, True),
+    ('id_number', 'citizen_id', 'ID Number', _validate_citizen_id_stripped, True),
+    ('birth_date', 'dob', 'Birth Date', _check_date_format, True),
+    ('gender', None, None, None, True),
+    ('relation_to_head', 'relationship', 'Relationship', validate_relationship, True),
+)
+
+# Shared "<field> là bắt buộc" results for every required field in the schemas above
+_REQUIRED_ERRORS = {
+    field: {"valid": False, "error": f"{field} là bắt buộc"}
+    for field in (
+        *(entry[0] for entry in _PROFILE_REQUIRED_CHECKS),
+        *(entry[0] for schema in (_CITIZEN_CARD_SCHEMA, _RESIDENCE_SCHEMA, _HOUSEHOLD_MEMBER_SCHEMA)
+          for entry in schema if entry[4]),
+    )
+}
 
-    # Validate ID Number
-    id_num = data.get('id_number') or data.get('citizen_id')
-    if id_num:
-        result = validate_citizen_id(id_num)
-        if not result["valid"]:
-            errors.append(f"ID Number: {result['error']}")
 
-    # Validate Dates
-    for date_field in ['birth_date', 'temporary_start', 'temporary_end']:
-        val = data.get(date_field)
-        if val:
-            if not re.match(r'^\d{2}/\d{2}/\d{4}$', str(val)):
-                errors.append(f"{date_field}: Invalid format (DD/MM/YYYY)")
+def validate_citizen_card_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate citizen card data against 'Citizen Card Data Guide'.
+    """
+    return _run_checks(data, _CITIZEN_CARD_SCHEMA)
 
-    if data.get('permanent_address'):
-        result = validate_address(data['permanent_address'])
-        if not result["valid"]:
-            errors.append(f"Permanent address: {result['error']}")
 
-    if data.get('current_address'):
-        result = validate_address(data['current_address'])
-        if not result["valid"]:
-            errors.append(f"Current address: {result['error']}")
-    
-    if data.get('relation_to_head') or data.get('relationship_to_head'):
-        val = data.get('relation_to_head') or data.get('relationship_to_head')
-        result = validate_relationship(val)
-        if not result["valid"]:
-            errors.append(f"Relation to head: {result['error']}")
-            
-    return {"valid": len(errors) == 0, "errors": errors}
+def validate_residence_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate residence data."""
+    return _run_checks(data, _RESIDENCE_SCHEMA)
 
 
 def validate_household_member_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate household member data."""
-    errors = []
-    
-    # Required fields for household member per schema
-    # Note: Schema says id_number, birth_date, gender are required
-    required_fields = ['full_name', 'id_number', 'birth_date', 'gender', 'relation_to_head']
-    
-    for field in required_fields:
-        # Handle field aliases
-        val = data.get(field)
-        if val is None:
-            if field == 'full_name': val = data.get('name')
-            elif field == 'id_number': val = data.get('citizen_id')
-            elif field == 'birth_date': val = data.get('dob')
-            elif field == 'relation_to_head': val = data.get('relationship')
-            
-        result = validate_required_field(val, field)
-        if not result["valid"]:
-            errors.append(result["error"])
-    
-    # Specific validations
-    name_val = data.get('full_name') or data.get('name')
-    if name_val:
-        result = validate_name(name_val)
-        if not result["valid"]:
-            errors.append(f"Name: {result['error']}")
-    
-    rel_val = data.get('relation_to_head') or data.get('relationship')
-    if rel_val:
-        result = validate_relationship(rel_val)
-        if not result["valid"]:
-            errors.append(f"Relationship: {result['error']}")
-    
-    id_val = data.get('id_number') or data.get('citizen_id')
-    if id_val:
-        result = validate_citizen_id(id_val)
-        if not result["valid"]:
-            errors.append(f"ID Number: {result['error']}")
-    
-    dob_val = data.get('birth_date') or data.get('dob')
-    if dob_val:
-        # Check string format for schema compliance
-        if not re.match(r'^\d{2}/\d{2}/\d{4}$', str(dob_val)):
-             errors.append(f"Birth Date: Invalid format (DD/MM/YYYY)")
-    
-    return {"valid": len(errors) == 0, "errors": errors}
+    return _run_checks(data, _HOUSEHOLD_MEMBER_SCHEMA)
 
 # Convenience functions for UserManager compatibility
 def validate_user_profile(data: Dict[str, Any]) -> List[str]:
@@ -443,7 +520,7 @@ def validate_user_profile(data: Dict[str, Any]) -> List[str]:
         List of validation error messages
     """
     result = validate_user_profile_data(data)
-    return result.get('errors', [])
+    return result.get('errors') or []
 
 
 def validate_citizen_card(data: Dict[str, Any]) -> List[str]:
@@ -457,7 +534,7 @@ def validate_citizen_card(data: Dict[str, Any]) -> List[str]:
         List of validation error messages
     """
     result = validate_citizen_card_data(data)
-    return result.get('errors', [])
+    return result.get('errors') or []
 
 
 def validate_residence(data: Dict[str, Any]) -> List[str]:
@@ -471,4 +548,4 @@ def validate_residence(data: Dict[str, Any]) -> List[str]:
         List of validation error messages
     """
     result = validate_residence_data(data)
-    return result.get('errors', [])
\ No newline at end of file
+    return result.get('errors') or []
\ No newline at end of file